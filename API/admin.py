@@ -1,11 +1,92 @@
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils import timezone
+from django.utils.functional import cached_property
 
-from django.contrib import admin
 from .models import *
 
-admin.site.register(Usuario)
-admin.site.register(Destino)
-admin.site.register(Itinerario)
-admin.site.register(ItinerarioDestino)
-admin.site.register(Post)
-admin.site.register(Respuesta)
\ No newline at end of file
+
+class PaginadorEstimado(Paginator):
+    """
+    Usa la estimación de filas de PostgreSQL (pg_class.reltuples) en lugar
+    de COUNT(*) cuando el changelist no tiene filtros y la tabla es grande.
+    """
+    umbral = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        conexion = connections[queryset.db]
+        if conexion.vendor == 'postgresql' and not queryset.query.where:
+            with conexion.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples FROM pg_class WHERE relname = %s',
+                    [queryset.model._meta.db_table]
+                )
+                fila = cursor.fetchone()
+            if fila and fila[0] >= self.umbral:
+                return int(fila[0])
+        return super().count
+
+
+class TablaGrandeAdmin(admin.ModelAdmin):
+    """Base para tablas grandes: sin COUNT(*) total y con conteo estimado"""
+    paginator = PaginadorEstimado
+    show_full_result_count = False
+
+
+@admin.register(Usuario)
+class UsuarioAdmin(TablaGrandeAdmin):
+    list_display = ('usuario_id', 'nombre', 'apellido', 'email', 'eliminado')
+    list_filter = ('eliminado',)
+    search_fields = ('=email',)
+
+    # Borrar desde el admin solo marca la cuenta (como la API); purgar_usuarios
+    # borra el contenido en lotes sin pasar por el Collector de Django
+    def get_deleted_objects(self, objs, request):
+        objs = list(objs)
+        permisos = set() if self.has_delete_permission(request) else {self.opts.verbose_name}
+        return [str(obj) for obj in objs], {self.opts.verbose_name_plural: len(objs)}, permisos, []
+
+    def delete_model(self, request, obj):
+        obj.marcar_eliminado()
+
+    def delete_queryset(self, request, queryset):
+        queryset.update(eliminado=True, fecha_eliminacion=timezone.now())
+
+
+@admin.register(Destino)
+class DestinoAdmin(admin.ModelAdmin):
+    list_display = ('destino_id', 'nombre', 'provincia', 'categoria', 'destacado')
+    search_fields = ('nombre',)
+
+
+@admin.register(Itinerario)
+class ItinerarioAdmin(TablaGrandeAdmin):
+    list_display = ('itinerario_id', 'titulo', 'usuario', 'compartido')
+    list_select_related = ('usuario',)
+    raw_id_fields = ('usuario',)
+
+
+@admin.register(ItinerarioDestino)
+class ItinerarioDestinoAdmin(TablaGrandeAdmin):
+    list_display = ('id', 'itinerario', 'destino', 'orden')
+    list_select_related = ('itinerario', 'destino')
+    raw_id_fields = ('itinerario',)
+    autocomplete_fields = ('destino',)
+
+
+@admin.register(Post)
+class PostAdmin(TablaGrandeAdmin):
+    list_display = ('post_id', 'usuario', 'destino', 'fecha_publicacion', 'likes')
+    list_select_related = ('usuario', 'destino')
+    raw_id_fields = ('usuario',)
+    autocomplete_fields = ('destino',)
+
+
+@admin.register(Respuesta)
+class RespuestaAdmin(TablaGrandeAdmin):
+    list_display = ('id_respuesta', 'usuario', 'post', 'fecha_creacion')
+    list_select_related = ('usuario', 'post')
+    raw_id_fields = ('usuario', 'post')
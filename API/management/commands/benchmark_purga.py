@@ -0,0 +1,64 @@
+import time
+import tracemalloc
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from API.models import Usuario, Destino, Itinerario, ItinerarioDestino, Post, Respuesta
+from API.purga import purgar_usuario
+
+
+class Command(BaseCommand):
+    help = (
+        'Crea usuarios sintéticos con N filas relacionadas, los purga y mide '
+        'memoria pico y tiempo. Ejecutar solo contra una base de desarrollo.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--filas', type=int, nargs='+', default=[10000, 100000],
+                            help='Posts por usuario (se crea una respuesta por post)')
+        parser.add_argument('--lote', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if settings.DEBUG:
+            self.stdout.write('DEBUG activo: se desactiva el registro de consultas durante la medición')
+        destino = Destino.objects.create(nombre='Benchmark', descripcion='')
+        try:
+            for filas in options['filas']:
+                usuario = self._crear_usuario(filas, destino)
+                usuario.marcar_eliminado()
+
+                # Con DEBUG=True connection.queries guarda cada DELETE y la
+                # memoria crecería con el número de lotes
+                with override_settings(DEBUG=False):
+                    tracemalloc.start()
+                    inicio = time.perf_counter()
+                    borrados = purgar_usuario(usuario.pk, options['lote'])
+                    duracion = time.perf_counter() - inicio
+                    _, pico = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+
+                self.stdout.write(
+                    f'{sum(borrados.values()):>8} filas {duracion:>8.2f} s '
+                    f'{pico / 1024:>10.1f} KiB pico'
+                )
+        finally:
+            destino.delete()
+
+    def _crear_usuario(self, filas, destino):
+        usuario = Usuario.objects.create(
+            nombre='Benchmark', apellido='Purga',
+            email=f'benchmark-purga-{time.time_ns()}@example.com', contrasena='!'
+        )
+        itinerario = Itinerario.objects.create(usuario=usuario, titulo='Benchmark')
+        ItinerarioDestino.objects.create(itinerario=itinerario, destino=destino)
+        for inicio in range(0, filas, 5000):
+            cantidad = min(5000, filas - inicio)
+            posts = Post.objects.bulk_create(
+                Post(usuario=usuario, contenido='x') for _ in range(cantidad)
+            )
+            Respuesta.objects.bulk_create(
+                Respuesta(usuario=usuario, post=post, contenido='x') for post in posts
+            )
+        return usuario
@@ -0,0 +1,69 @@
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from API.middleware import COMPRESORES, brotli, config_compresion
+from API.models import Destino
+from API.renderers import ORJSONRenderer
+from API.serializers import DestinoSerializer
+
+
+DESCRIPCION = (
+    'Destino turístico con playas de arena blanca, montañas cubiertas de '
+    'bosque nuboso y una gastronomía típica reconocida en toda la región. '
+)
+
+
+class Command(BaseCommand):
+    help = 'Mide bytes enviados y CPU por respuesta del listado de destinos'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--cantidad', type=int, default=500,
+                            help='Destinos sintéticos a serializar')
+        parser.add_argument('--repeticiones', type=int, default=20)
+        parser.add_argument('--usar-bd', action='store_true',
+                            help='Usa los destinos de la base de datos')
+
+    def handle(self, *args, **options):
+        if options['usar_bd']:
+            destinos = list(Destino.objects.all())
+        else:
+            destinos = [
+                Destino(
+                    destino_id=i,
+                    nombre=f'Destino {i}',
+                    provincia='Guanacaste',
+                    descripcion=DESCRIPCION * 8,
+                    galeria_imagenes=','.join(f'/img/{i}/{n}.jpg' for n in range(10)),
+                    categoria='playa',
+                    calificacion=i % 5
+                )
+                for i in range(options['cantidad'])
+            ]
+        data = DestinoSerializer(destinos, many=True).data
+        repeticiones = options['repeticiones']
+        config = config_compresion()
+
+        self.stdout.write(f'{len(destinos)} destinos, {repeticiones} repeticiones')
+        for renderer in (JSONRenderer(), ORJSONRenderer()):
+            contenido, cpu = self._medir(lambda: renderer.render(data), repeticiones)
+            self.stdout.write(
+                f'{type(renderer).__name__:<16} {len(contenido):>10} bytes {cpu:>9.2f} ms CPU'
+            )
+
+        for codificacion, comprimir in COMPRESORES.items():
+            if codificacion == 'br' and brotli is None:
+                self.stdout.write('br               no instalado')
+                continue
+            comprimido, cpu = self._medir(lambda: comprimir(contenido, config), repeticiones)
+            self.stdout.write(
+                f'+ {codificacion:<14} {len(comprimido):>10} bytes {cpu:>9.2f} ms CPU'
+            )
+
+    def _medir(self, funcion, repeticiones):
+        """Devuelve el resultado y el tiempo de CPU medio en milisegundos"""
+        inicio = time.process_time()
+        for _ in range(repeticiones):
+            resultado = funcion()
+        return resultado, (time.process_time() - inicio) * 1000 / repeticiones
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from API.purga import purgar_usuario, usuarios_pendientes
+
+
+class Command(BaseCommand):
+    help = (
+        'Borra definitivamente los usuarios marcados como eliminados y su '
+        'contenido en lotes. Es seguro interrumpirlo y volver a ejecutarlo. '
+        'Debe programarse periódicamente (p. ej. un Cron Job de Render con '
+        '"python manage.py purgar_usuarios" cada hora): hasta que corre, las '
+        'cuentas eliminadas siguen en la base y su email sigue registrado.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--usuario', type=int, action='append',
+                            help='Purga solo este usuario (se puede repetir)')
+        parser.add_argument('--lote', type=int, default=1000,
+                            help='Filas borradas por sentencia DELETE')
+        parser.add_argument('--pausa', type=float, default=0.05,
+                            help='Segundos de espera entre lotes')
+
+    def handle(self, *args, **options):
+        usuarios = options['usuario'] or list(usuarios_pendientes())
+        for usuario_id in usuarios:
+            borrados = purgar_usuario(usuario_id, options['lote'], options['pausa'])
+            if borrados is None:
+                raise CommandError(f'El usuario {usuario_id} no existe o no está marcado como eliminado')
+            detalle = ', '.join(f'{modelo}: {cantidad}' for modelo, cantidad in borrados.items())
+            self.stdout.write(f'Usuario {usuario_id} purgado ({detalle})')
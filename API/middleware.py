@@ -0,0 +1,105 @@
+import gzip
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+COMPRESION_POR_DEFECTO = {
+    'ALGORITMOS': ['br', 'gzip'],
+    'TIPOS_CONTENIDO': ['application/json'],
+    'TAMANO_MINIMO': 1024,
+    'NIVEL_GZIP': 6,
+    'CALIDAD_BROTLI': 5,
+}
+
+
+def config_compresion():
+    """Configuración efectiva: COMPRESION_POR_DEFECTO más COMPRESION_RESPUESTAS"""
+    return {**COMPRESION_POR_DEFECTO, **getattr(settings, 'COMPRESION_RESPUESTAS', {})}
+
+def _comprimir_gzip(contenido, config):
+    return gzip.compress(contenido, compresslevel=config['NIVEL_GZIP'], mtime=0)
+
+def _comprimir_brotli(contenido, config):
+    return brotli.compress(contenido, quality=config['CALIDAD_BROTLI'])
+
+COMPRESORES = {
+    'gzip': _comprimir_gzip,
+    'br': _comprimir_brotli,
+}
+
+def negociar_codificacion(accept_encoding, algoritmos):
+    """Elige el primer algoritmo del servidor aceptado por el cliente (q > 0)"""
+    aceptados = {}
+    for parte in accept_encoding.split(','):
+        nombre, _, parametros = parte.strip().partition(';')
+        calidad = 1.0
+        parametros = parametros.strip()
+        if parametros.startswith('q='):
+            try:
+                calidad = float(parametros[2:])
+            except ValueError:
+                calidad = 0.0
+        if nombre:
+            aceptados[nombre.strip().lower()] = calidad
+
+    for algoritmo in algoritmos:
+        if algoritmo == 'br' and brotli is None:
+            continue
+        if aceptados.get(algoritmo, aceptados.get('*', 0)) > 0:
+            return algoritmo
+    return None
+
+
+class CompresionMiddleware(MiddlewareMixin):
+    """
+    Comprime respuestas con brotli o gzip según Accept-Encoding.
+
+    Solo se comprimen los TIPOS_CONTENIDO configurados: el HTML del admin y
+    de la API navegable lleva tokens CSRF y comprimirlo expone a BREACH.
+    Las respuestas streaming (p. ej. estáticos de WhiteNoise), las ya
+    codificadas, las marcadas no-transform y las menores a TAMANO_MINIMO
+    se devuelven tal cual.
+    """
+
+    def process_response(self, request, response):
+        config = config_compresion()
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+        tipo = response.get('Content-Type', '').split(';')[0].strip().lower()
+        if tipo not in config['TIPOS_CONTENIDO']:
+            return response
+        directivas = [d.strip().lower() for d in response.get('Cache-Control', '').split(',')]
+        if 'no-transform' in directivas:
+            return response
+        if len(response.content) < config['TAMANO_MINIMO']:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        codificacion = negociar_codificacion(
+            request.META.get('HTTP_ACCEPT_ENCODING', ''),
+            config['ALGORITMOS']
+        )
+        if codificacion is None:
+            return response
+
+        comprimido = COMPRESORES[codificacion](response.content, config)
+        if len(comprimido) >= len(response.content):
+            return response
+
+        response.content = comprimido
+        response.headers['Content-Length'] = str(len(comprimido))
+        response.headers['Content-Encoding'] = codificacion
+
+        # El contenido cambió: un ETag fuerte ya no es válido
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        return response
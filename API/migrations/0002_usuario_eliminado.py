@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-19 18:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('API', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usuario',
+            name='eliminado',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AddField(
+            model_name='usuario',
+            name='fecha_eliminacion',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -1,4 +1,26 @@
 from django.db import models
+from django.utils import timezone
+
+class UsuarioQuerySet(models.QuerySet):
+    def visibles(self):
+        """Excluye usuarios marcados como eliminados"""
+        return self.filter(eliminado=False)
+
+class ItinerarioQuerySet(models.QuerySet):
+    def visibles(self):
+        return self.filter(usuario__eliminado=False)
+
+class ItinerarioDestinoQuerySet(models.QuerySet):
+    def visibles(self):
+        return self.filter(itinerario__usuario__eliminado=False)
+
+class PostQuerySet(models.QuerySet):
+    def visibles(self):
+        return self.filter(usuario__eliminado=False)
+
+class RespuestaQuerySet(models.QuerySet):
+    def visibles(self):
+        return self.filter(usuario__eliminado=False, post__usuario__eliminado=False)
 
 class Usuario(models.Model):
     usuario_id = models.AutoField(primary_key=True)
@@ -11,10 +33,20 @@ class Usuario(models.Model):
     fecha_registro = models.DateTimeField(auto_now_add=True)
     ultimo_acceso = models.DateTimeField(null=True, blank=True)
     foto_perfil = models.CharField(max_length=255, null=True, blank=True)
+    eliminado = models.BooleanField(default=False, db_index=True)
+    fecha_eliminacion = models.DateTimeField(null=True, blank=True)
+
+    objects = UsuarioQuerySet.as_manager()
 
     def __str__(self):
         return f"{self.nombre} {self.apellido}"
 
+    def marcar_eliminado(self):
+        """Oculta la cuenta y su contenido; el borrado real lo hace purgar_usuarios"""
+        self.eliminado = True
+        self.fecha_eliminacion = timezone.now()
+        self.save(update_fields=['eliminado', 'fecha_eliminacion'])
+
 class Destino(models.Model):
     destino_id = models.AutoField(primary_key=True)
     nombre = models.CharField(max_length=255)
@@ -36,6 +68,8 @@ class Itinerario(models.Model):
     fecha_creacion = models.DateTimeField(auto_now_add=True)
     compartido = models.BooleanField(default=False)
 
+    objects = ItinerarioQuerySet.as_manager()
+
     def __str__(self):
         return self.titulo
 
@@ -44,6 +78,8 @@ class ItinerarioDestino(models.Model):
     destino = models.ForeignKey(Destino, on_delete=models.CASCADE)
     orden = models.IntegerField(null=True, blank=True)
 
+    objects = ItinerarioDestinoQuerySet.as_manager()
+
     class Meta:
         unique_together = (('itinerario', 'destino'),)
 
@@ -58,6 +94,8 @@ class Post(models.Model):
     fecha_publicacion = models.DateTimeField(auto_now_add=True)
     likes = models.IntegerField(default=0)
 
+    objects = PostQuerySet.as_manager()
+
     def __str__(self):
         return f"Post #{self.post_id}"
 
@@ -68,5 +106,7 @@ class Respuesta(models.Model):
     contenido = models.TextField()
     fecha_creacion = models.DateTimeField(auto_now_add=True)
 
+    objects = RespuestaQuerySet.as_manager()
+
     def __str__(self):
         return f"Respuesta #{self.id_respuesta}"
\ No newline at end of file
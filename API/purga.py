@@ -0,0 +1,53 @@
+import time
+
+from django.db.models import Q
+
+from .models import Usuario, Itinerario, ItinerarioDestino, Post, Respuesta
+
+
+def _borrar_en_lotes(queryset, tamano_lote, pausa):
+    """
+    Borra las filas del queryset en lotes de tamano_lote con SQL directo.
+
+    Usa _raw_delete para no pasar por el Collector de Django (que carga en
+    memoria cada fila relacionada y dispara señales). Solo se cargan los IDs
+    de un lote a la vez, así que la memoria no crece con el volumen.
+    """
+    modelo = queryset.model
+    total = 0
+    while True:
+        ids = list(queryset.order_by().values_list('pk', flat=True)[:tamano_lote])
+        if not ids:
+            return total
+        lote = modelo._base_manager.filter(pk__in=ids)
+        total += lote._raw_delete(lote.db)
+        if pausa:
+            time.sleep(pausa)
+
+def purgar_usuario(usuario_id, tamano_lote=1000, pausa=0):
+    """
+    Borra definitivamente un usuario marcado como eliminado y su contenido.
+
+    Se borra de las hojas hacia la raíz para respetar las claves foráneas,
+    de modo que si el proceso se interrumpe basta con volver a ejecutarlo.
+    Devuelve la cantidad de filas borradas por modelo, o None si el usuario
+    no existe o no está marcado como eliminado (no se borra nada).
+    """
+    if not Usuario.objects.filter(pk=usuario_id, eliminado=True).exists():
+        return None
+
+    borrados = {}
+    pasos = [
+        (Respuesta, Respuesta.objects.filter(Q(usuario_id=usuario_id) | Q(post__usuario_id=usuario_id))),
+        (Post, Post.objects.filter(usuario_id=usuario_id)),
+        (ItinerarioDestino, ItinerarioDestino.objects.filter(itinerario__usuario_id=usuario_id)),
+        (Itinerario, Itinerario.objects.filter(usuario_id=usuario_id)),
+        (Usuario, Usuario.objects.filter(pk=usuario_id, eliminado=True)),
+    ]
+    for modelo, queryset in pasos:
+        borrados[modelo.__name__] = _borrar_en_lotes(queryset, tamano_lote, pausa)
+    return borrados
+
+def usuarios_pendientes():
+    """IDs de usuarios marcados como eliminados, los más antiguos primero"""
+    return Usuario.objects.filter(eliminado=True).order_by('fecha_eliminacion').values_list('pk', flat=True)
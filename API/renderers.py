@@ -0,0 +1,41 @@
+from rest_framework import renderers
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_encoder = encoders.JSONEncoder()
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    """
+    Renderer JSON basado en orjson; usa el de DRF si orjson no está instalado.
+
+    Las fechas se delegan al encoder de DRF para producir la misma salida
+    (p. ej. "Z" en datetimes UTC). Los enteros de más de 64 bits recurren al
+    renderer de DRF. A diferencia de DRF en modo estricto, NaN e infinito
+    se escriben como null en lugar de lanzar ValueError.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+
+        opciones = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            opciones |= orjson.OPT_INDENT_2
+
+        # El encoder de DRF resuelve Decimal, textos lazy, querysets, etc.
+        try:
+            ret = orjson.dumps(data, default=_encoder.default, option=opciones)
+        except orjson.JSONEncodeError:
+            # Enteros fuera de rango de 64 bits, entre otros casos
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Igual que DRF: escapa separadores de línea inválidos en JavaScript
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
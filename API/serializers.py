@@ -1,8 +1,114 @@
 from rest_framework import serializers
 from .models import Usuario, Destino, Itinerario, ItinerarioDestino, Post, Respuesta
 from django.contrib.auth.hashers import make_password
+from django.core.exceptions import FieldDoesNotExist
 
-class UsuarioSerializer(serializers.ModelSerializer):
+
+def parametros_dinamicos(request):
+    """Lee ?fields= y ?expand= de la petición (fields es None si no se pidió)"""
+    fields = request.query_params.get('fields')
+    expand = request.query_params.get('expand')
+    return (
+        [f.strip() for f in fields.split(',') if f.strip()] if fields else None,
+        [e.strip() for e in expand.split(',') if e.strip()] if expand else [],
+    )
+
+def _separar_rutas(rutas):
+    """Separa ['destino.nombre', 'likes'] en nombres propios y sub-rutas por campo"""
+    propios, anidados = set(), {}
+    for ruta in rutas:
+        nombre, _, resto = ruta.partition('.')
+        propios.add(nombre)
+        if resto:
+            anidados.setdefault(nombre, []).append(resto)
+    return propios, anidados
+
+def _rutas_queryset(serializer, prefijo=''):
+    """Columnas (only) y joins (select_related) que necesita un serializer"""
+    modelo = serializer.Meta.model
+    columnas, joins = [], []
+    for campo in serializer.fields.values():
+        if campo.write_only or campo.source == '*':
+            continue
+        nombre = campo.source.split('.')[0]
+        try:
+            campo_modelo = modelo._meta.get_field(nombre)
+        except FieldDoesNotExist:
+            continue
+        if not campo_modelo.concrete or campo_modelo.many_to_many:
+            continue
+        columnas.append(prefijo + nombre)
+        if isinstance(campo, serializers.BaseSerializer):
+            joins.append(prefijo + nombre)
+            sub_columnas, sub_joins = _rutas_queryset(campo, f'{prefijo}{nombre}__')
+            columnas += sub_columnas
+            joins += sub_joins
+        elif campo_modelo.is_relation and not isinstance(campo, serializers.PrimaryKeyRelatedField):
+            # StringRelatedField y similares: solo las columnas de Meta.related_only_fields
+            # (sin la pista se carga el objeto relacionado completo)
+            joins.append(prefijo + nombre)
+            relacionadas = getattr(serializer.Meta, 'related_only_fields', {}).get(nombre, [])
+            columnas += [f'{prefijo}{nombre}__{columna}' for columna in relacionadas]
+    return columnas, joins
+
+class CamposDinamicosMixin:
+    """
+    Soporte de ?fields= y ?expand= para serializers.
+
+    Las relaciones listadas en Meta.expandable_fields se devuelven como ID
+    salvo que se pidan en expand. Ambos parámetros aceptan rutas con punto
+    (p. ej. fields=destino.nombre&expand=destino) que se pasan al anidado.
+    Una relación escribible nunca se reemplaza cuando el serializer recibe
+    datos, para no perder su validación.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        expand = kwargs.pop('expand', None)
+        super().__init__(*args, **kwargs)
+
+        request = self.context.get('request')
+        if fields is None and expand is None and request is not None:
+            fields, expand = parametros_dinamicos(request)
+
+        self._fields_anidados = {}
+        if fields is not None:
+            propios, self._fields_anidados = _separar_rutas(fields)
+            for nombre in list(self.fields):
+                if nombre not in propios and not self.fields[nombre].write_only:
+                    self.fields.pop(nombre)
+
+        expandir, self._expand_anidados = _separar_rutas(expand or [])
+        expandibles = getattr(self.Meta, 'expandable_fields', {})
+        for nombre, serializer_class in expandibles.items():
+            if nombre not in self.fields:
+                continue
+            escribible = not self.fields[nombre].read_only
+            if escribible and hasattr(self, 'initial_data'):
+                continue
+            if nombre in expandir:
+                anidado = serializer_class(
+                    read_only=True,
+                    fields=self._fields_anidados.get(nombre),
+                    expand=self._expand_anidados.get(nombre, [])
+                )
+                if any(not campo.write_only for campo in anidado.fields.values()):
+                    self.fields[nombre] = anidado
+                else:
+                    # Ningún subcampo pedido existe: no se carga la relación
+                    self.fields.pop(nombre)
+            elif not escribible:
+                self.fields[nombre] = serializers.PrimaryKeyRelatedField(read_only=True)
+
+    @classmethod
+    def optimizar_queryset(cls, queryset, fields=None, expand=None):
+        """Difiere las columnas no pedidas y solo hace join de lo expandido"""
+        columnas, joins = _rutas_queryset(cls(fields=fields, expand=expand or []))
+        if joins:
+            queryset = queryset.select_related(*joins)
+        return queryset.only(*columnas)
+
+class UsuarioSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     class Meta:
         model = Usuario
         fields = [
@@ -31,7 +137,7 @@ class UsuarioSerializer(serializers.ModelSerializer):
         validated_data['contrasena'] = make_password(validated_data['contrasena'])
         return super().create(validated_data)
 
-class DestinoSerializer(serializers.ModelSerializer):
+class DestinoSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     class Meta:
         model = Destino
         fields = [
@@ -46,7 +152,7 @@ class DestinoSerializer(serializers.ModelSerializer):
             'calificacion'
         ]
 
-class ItinerarioSerializer(serializers.ModelSerializer):
+class ItinerarioSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     usuario = serializers.PrimaryKeyRelatedField(read_only=True)
     
     class Meta:
@@ -60,8 +166,8 @@ class ItinerarioSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['fecha_creacion']
 
-class ItinerarioDestinoSerializer(serializers.ModelSerializer):
-    destino = DestinoSerializer(read_only=True)
+class ItinerarioDestinoSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
+    destino = serializers.PrimaryKeyRelatedField(read_only=True)
     destino_id = serializers.PrimaryKeyRelatedField(
         queryset=Destino.objects.all(),
         source='destino',
@@ -80,10 +186,15 @@ class ItinerarioDestinoSerializer(serializers.ModelSerializer):
         extra_kwargs = {
             'itinerario': {'read_only': True}
         }
+        # itinerario no es expandible: destinos/<id>/itinerarios/ es público
+        # y expondría itinerarios privados de otros usuarios
+        expandable_fields = {
+            'destino': DestinoSerializer
+        }
 
-class PostSerializer(serializers.ModelSerializer):
+class PostSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     usuario = serializers.StringRelatedField(read_only=True)
-    destino = DestinoSerializer(read_only=True)
+    destino = serializers.PrimaryKeyRelatedField(read_only=True)
     destino_id = serializers.PrimaryKeyRelatedField(
         queryset=Destino.objects.all(),
         source='destino',
@@ -104,8 +215,14 @@ class PostSerializer(serializers.ModelSerializer):
             'likes'
         ]
         read_only_fields = ['fecha_publicacion', 'likes']
+        expandable_fields = {
+            'destino': DestinoSerializer
+        }
+        related_only_fields = {
+            'usuario': ['nombre', 'apellido']
+        }
 
-class RespuestaSerializer(serializers.ModelSerializer):
+class RespuestaSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     usuario = serializers.StringRelatedField(read_only=True)
     
     class Meta:
@@ -118,6 +235,12 @@ class RespuestaSerializer(serializers.ModelSerializer):
             'fecha_creacion'
         ]
         read_only_fields = ['fecha_creacion']
+        expandable_fields = {
+            'post': PostSerializer
+        }
+        related_only_fields = {
+            'usuario': ['nombre', 'apellido']
+        }
 
 # Serializadores para relaciones anidadas
 class ItinerarioConDestinosSerializer(ItinerarioSerializer):
@@ -127,8 +250,11 @@ class ItinerarioConDestinosSerializer(ItinerarioSerializer):
         fields = ItinerarioSerializer.Meta.fields + ['destinos']
     
     def get_destinos(self, obj):
-        destinos = ItinerarioDestino.objects.filter(itinerario=obj).order_by('orden')
-        return ItinerarioDestinoSerializer(destinos, many=True).data
+        fields = self._fields_anidados.get('destinos')
+        expand = self._expand_anidados.get('destinos', [])
+        destinos = ItinerarioDestino.objects.visibles().filter(itinerario=obj).order_by('orden')
+        destinos = ItinerarioDestinoSerializer.optimizar_queryset(destinos, fields, expand)
+        return ItinerarioDestinoSerializer(destinos, many=True, fields=fields, expand=expand).data
 
 class PostConRespuestasSerializer(PostSerializer):
     respuestas = serializers.SerializerMethodField()
@@ -137,5 +263,8 @@ class PostConRespuestasSerializer(PostSerializer):
         fields = PostSerializer.Meta.fields + ['respuestas']
     
     def get_respuestas(self, obj):
-        respuestas = Respuesta.objects.filter(post=obj)
-        return RespuestaSerializer(respuestas, many=True).data
\ No newline at end of file
+        fields = self._fields_anidados.get('respuestas')
+        expand = self._expand_anidados.get('respuestas', [])
+        respuestas = Respuesta.objects.visibles().filter(post=obj)
+        respuestas = RespuestaSerializer.optimizar_queryset(respuestas, fields, expand)
+        return RespuestaSerializer(respuestas, many=True, fields=fields, expand=expand).data
\ No newline at end of file
@@ -1,3 +1,339 @@
-from django.test import TestCase
+import datetime
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db import connections
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from . import purga
+from .admin import PaginadorEstimado
+from .middleware import CompresionMiddleware
+from .renderers import ORJSONRenderer
+from .serializers import RespuestaSerializer
+from .models import Usuario, Destino, Itinerario, ItinerarioDestino, Post, Respuesta
+
+
+class CamposDinamicosTests(APITestCase):
+
+    def setUp(self):
+        self.usuario = Usuario.objects.create(
+            nombre='Ana', apellido='Mora', email='ana@example.com', contrasena='secreta'
+        )
+        self.destino = Destino.objects.create(
+            nombre='Tortuguero', provincia='Limón', descripcion='Canales y tortugas',
+            galeria_imagenes='/img/1.jpg'
+        )
+        self.post = Post.objects.create(usuario=self.usuario, destino=self.destino, contenido='Contenido')
+        Respuesta.objects.create(usuario=self.usuario, post=self.post, contenido='Respuesta')
+        itinerario = Itinerario.objects.create(usuario=self.usuario, titulo='Caribe')
+        ItinerarioDestino.objects.create(itinerario=itinerario, destino=self.destino, orden=1)
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as consultas:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.json(), [consulta['sql'] for consulta in consultas]
+
+    def test_destino_sin_expandir_es_id_sin_join(self):
+        data, consultas = self.get('/turismo/API/posts/')
+        self.assertEqual(data[0]['destino'], self.destino.pk)
+        self.assertEqual(data[0]['usuario'], 'Ana Mora')
+        self.assertEqual(len(consultas), 1)
+        self.assertNotIn('"API_destino"', consultas[0])
+
+    def test_fields_reduce_el_select(self):
+        data, consultas = self.get('/turismo/API/posts/?fields=post_id,destino')
+        self.assertEqual(data, [{'post_id': self.post.pk, 'destino': self.destino.pk}])
+        self.assertNotIn('contenido', consultas[0])
+        self.assertNotIn('"API_destino"', consultas[0])
+
+    def test_expand_con_ruta_anidada(self):
+        data, consultas = self.get('/turismo/API/posts/?expand=destino&fields=post_id,destino.nombre')
+        self.assertEqual(data, [{'post_id': self.post.pk, 'destino': {'nombre': 'Tortuguero'}}])
+        self.assertEqual(len(consultas), 1)
+        self.assertIn('"API_destino"."nombre"', consultas[0])
+        self.assertNotIn('descripcion', consultas[0])
+
+    def test_expand_completo(self):
+        data, _ = self.get('/turismo/API/posts/?expand=destino')
+        self.assertEqual(data[0]['destino']['descripcion'], 'Canales y tortugas')
+        self.assertEqual(data[0]['destino']['galeria_imagenes'], '/img/1.jpg')
+
+    def test_subcampos_inexistentes_no_hacen_join(self):
+        data, consultas = self.get('/turismo/API/posts/?expand=destino&fields=post_id,destino.bogus')
+        self.assertEqual(data, [{'post_id': self.post.pk}])
+        self.assertEqual(len(consultas), 1)
+        self.assertNotIn('"API_destino"', consultas[0])
+
+    def test_rutas_anidadas_en_relaciones_inversas(self):
+        data, _ = self.get(f'/turismo/API/posts/{self.post.pk}/?fields=post_id,respuestas.contenido')
+        self.assertEqual(data, {'post_id': self.post.pk, 'respuestas': [{'contenido': 'Respuesta'}]})
+
+        url = f'/turismo/API/destinos/{self.destino.pk}/itinerarios/?expand=destino&fields=orden,destino.nombre'
+        data, _ = self.get(url)
+        self.assertEqual(data, [{'orden': 1, 'destino': {'nombre': 'Tortuguero'}}])
+
+    def test_join_de_usuario_sin_columnas_privadas(self):
+        data, consultas = self.get('/turismo/API/posts/?fields=post_id,usuario')
+        self.assertEqual(data, [{'post_id': self.post.pk, 'usuario': 'Ana Mora'}])
+        self.assertIn('"API_usuario"."nombre"', consultas[0])
+        self.assertNotIn('contrasena', consultas[0])
+        self.assertNotIn('email', consultas[0])
+
+    def test_expand_itinerario_no_expone_privados(self):
+        privado = Itinerario.objects.create(usuario=self.usuario, titulo='Luna de miel secreta')
+        ItinerarioDestino.objects.create(itinerario=privado, destino=self.destino, orden=2)
+
+        response = self.client.get(f'/turismo/API/destinos/{self.destino.pk}/itinerarios/?expand=itinerario')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Luna de miel secreta', response.content.decode())
+        self.assertIn(privado.pk, [fila['itinerario'] for fila in response.json()])
+
+    def test_relacion_escribible_se_sigue_validando(self):
+        for expand in ([], ['post']):
+            with self.subTest(expand=expand):
+                serializer = RespuestaSerializer(data={'post': self.post.pk, 'contenido': 'Hola'}, expand=expand)
+                self.assertTrue(serializer.is_valid(), serializer.errors)
+                self.assertEqual(serializer.validated_data['post'], self.post)
+
+                serializer = RespuestaSerializer(data={'contenido': 'Hola'}, expand=expand)
+                self.assertFalse(serializer.is_valid())
+                self.assertIn('post', serializer.errors)
+
+    def test_campos_write_only_ocultos(self):
+        data, consultas = self.get('/turismo/API/usuarios/')
+        self.assertNotIn('contrasena', data[0])
+        self.assertNotIn('contrasena', consultas[0])
+
+        data, _ = self.get('/turismo/API/usuarios/?fields=email,contrasena')
+        self.assertEqual(data, [{'email': 'ana@example.com'}])
+
+
+class ORJSONRendererTests(TestCase):
+
+    def test_misma_salida_que_drf(self):
+        data = {
+            'fecha_hora': datetime.datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=datetime.timezone.utc),
+            'fecha': datetime.date(2024, 1, 2),
+            'hora': datetime.time(1, 2, 3),
+            'decimal': Decimal('1.5'),
+            'entero_grande': 2 ** 70,
+            'texto': 'Guanacaste \u2028',
+            1: 'clave numérica',
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+
+class CompresionMiddlewareTests(TestCase):
+
+    def comprimir(self, content_type='application/json', cache_control=None):
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='gzip')
+        response = HttpResponse(b'{"nombre": "Destino"}' * 200, content_type=content_type)
+        if cache_control:
+            response['Cache-Control'] = cache_control
+        return CompresionMiddleware(lambda request: response)(request)
+
+    @override_settings(COMPRESION_RESPUESTAS={'ALGORITMOS': ['gzip']})
+    def test_comprime_json(self):
+        response = self.comprimir()
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+    def test_no_comprime_html(self):
+        self.assertFalse(self.comprimir('text/html; charset=utf-8').has_header('Content-Encoding'))
+
+    def test_respeta_no_transform(self):
+        response = self.comprimir(cache_control='private, no-transform')
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+
+# Los tests no ejecutan collectstatic (lo hace build.sh), así que no hay manifest
+@override_settings(STORAGES={
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+})
+class AdminChangelistTests(TestCase):
+    """Las consultas de cada changelist no deben crecer con el número de filas"""
+
+    modelos = [Usuario, Destino, Itinerario, ItinerarioDestino, Post, Respuesta]
+
+    def setUp(self):
+        admin = User.objects.create_superuser('admin', 'admin@example.com', 'admin')
+        self.client.force_login(admin)
+        self.creados = 0
+
+    def crear_datos(self, cantidad):
+        for _ in range(cantidad):
+            self.creados += 1
+            n = self.creados
+            usuario = Usuario.objects.create(
+                nombre=f'Nombre {n}', apellido='Apellido',
+                email=f'usuario{n}@example.com', contrasena='!'
+            )
+            destino = Destino.objects.create(nombre=f'Destino {n}', descripcion='')
+            itinerario = Itinerario.objects.create(usuario=usuario, titulo=f'Itinerario {n}')
+            ItinerarioDestino.objects.create(itinerario=itinerario, destino=destino, orden=1)
+            post = Post.objects.create(usuario=usuario, destino=destino, contenido='Contenido')
+            Respuesta.objects.create(usuario=usuario, post=post, contenido='Respuesta')
+
+    def contar_consultas(self, modelo):
+        url = reverse(f'admin:API_{modelo._meta.model_name}_changelist')
+        with CaptureQueriesContext(connection) as consultas:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(consultas)
+
+    def test_consultas_constantes(self):
+        self.crear_datos(2)
+        pocas = {modelo: self.contar_consultas(modelo) for modelo in self.modelos}
+        self.crear_datos(20)
+        for modelo in self.modelos:
+            with self.subTest(modelo=modelo.__name__):
+                self.assertEqual(self.contar_consultas(modelo), pocas[modelo])
+
+
+@override_settings(STORAGES={
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+})
+class UsuarioAdminTests(TestCase):
+
+    def setUp(self):
+        admin = User.objects.create_superuser('admin', 'admin@example.com', 'admin')
+        self.client.force_login(admin)
+        self.usuarios = [
+            Usuario.objects.create(nombre='Nombre', apellido=str(n), email=f'u{n}@example.com', contrasena='!')
+            for n in range(2)
+        ]
+        for usuario in self.usuarios:
+            Post.objects.create(usuario=usuario, contenido='Contenido')
+
+    def assertMarcados(self, usuarios):
+        for usuario in usuarios:
+            usuario.refresh_from_db()
+            self.assertTrue(usuario.eliminado)
+            self.assertIsNotNone(usuario.fecha_eliminacion)
+        self.assertEqual(Post.objects.filter(usuario__in=usuarios).count(), len(usuarios))
+
+    def test_borrar_marca_la_cuenta(self):
+        url = reverse('admin:API_usuario_delete', args=[self.usuarios[0].pk])
+        self.assertEqual(self.client.get(url).status_code, 200)
+        response = self.client.post(url, {'post': 'yes'})
+        self.assertEqual(response.status_code, 302)
+        self.assertMarcados(self.usuarios[:1])
+
+    def test_accion_borrar_seleccionados_marca_las_cuentas(self):
+        response = self.client.post(reverse('admin:API_usuario_changelist'), {
+            'action': 'delete_selected',
+            '_selected_action': [usuario.pk for usuario in self.usuarios],
+            'post': 'yes',
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertMarcados(self.usuarios)
+
+
+class PaginadorEstimadoTests(TestCase):
+
+    def setUp(self):
+        for n in range(3):
+            Destino.objects.create(nombre=f'Destino {n}', descripcion='')
+        self.conexion = connections['default']
+
+    def estimacion_postgres(self, filas):
+        """Simula PostgreSQL con pg_class.reltuples = filas para la primera consulta"""
+        cursor_real = self.conexion.cursor
+        self.cursor_falso = mock.MagicMock()
+        self.cursor_falso.__enter__.return_value.fetchone.return_value = (filas,)
+        pendientes = [self.cursor_falso]
+        return mock.patch.multiple(
+            self.conexion,
+            vendor='postgresql',
+            cursor=lambda: pendientes.pop() if pendientes else cursor_real()
+        )
+
+    def test_usa_estimacion_en_tablas_grandes(self):
+        with self.estimacion_postgres(50000.0), CaptureQueriesContext(self.conexion) as consultas:
+            count = PaginadorEstimado(Destino.objects.order_by('pk'), 100).count
+        self.assertEqual(count, 50000)
+        self.assertEqual(len(consultas), 0)
+        self.cursor_falso.__enter__.return_value.execute.assert_called_once_with(
+            'SELECT reltuples FROM pg_class WHERE relname = %s', [Destino._meta.db_table]
+        )
+
+    def test_cuenta_exacta_bajo_el_umbral(self):
+        with self.estimacion_postgres(5.0):
+            count = PaginadorEstimado(Destino.objects.order_by('pk'), 100).count
+        self.assertEqual(count, 3)
+
+    def test_cuenta_exacta_con_filtros(self):
+        # Sin cursor simulado: consultar pg_class en SQLite fallaría
+        with mock.patch.object(self.conexion, 'vendor', 'postgresql'):
+            count = PaginadorEstimado(Destino.objects.filter(nombre='Destino 1').order_by('pk'), 100).count
+        self.assertEqual(count, 1)
+
+
+class PurgaTests(TestCase):
+
+    def setUp(self):
+        self.destino = Destino.objects.create(nombre='Destino', descripcion='')
+        self.usuario = self.crear_usuario('usuario@example.com')
+        self.otro = self.crear_usuario('otro@example.com')
+
+    def crear_usuario(self, email):
+        usuario = Usuario.objects.create(nombre='Nombre', apellido='Apellido', email=email, contrasena='!')
+        itinerario = Itinerario.objects.create(usuario=usuario, titulo='Itinerario')
+        ItinerarioDestino.objects.create(itinerario=itinerario, destino=self.destino, orden=1)
+        post = Post.objects.create(usuario=usuario, destino=self.destino, contenido='Contenido')
+        Respuesta.objects.create(usuario=usuario, post=post, contenido='Respuesta')
+        return usuario
+
+    def test_usuario_no_eliminado_no_se_toca(self):
+        self.assertIsNone(purga.purgar_usuario(self.usuario.pk))
+        self.assertTrue(Usuario.objects.filter(pk=self.usuario.pk).exists())
+        self.assertEqual(Post.objects.filter(usuario=self.usuario).count(), 1)
+        self.assertEqual(Respuesta.objects.filter(usuario=self.usuario).count(), 1)
+        self.assertEqual(Itinerario.objects.filter(usuario=self.usuario).count(), 1)
+        self.assertEqual(ItinerarioDestino.objects.filter(itinerario__usuario=self.usuario).count(), 1)
+
+    def test_borra_respuestas_de_otros_a_sus_posts(self):
+        post = Post.objects.get(usuario=self.usuario)
+        Respuesta.objects.create(usuario=self.otro, post=post, contenido='Respuesta ajena')
+        self.usuario.marcar_eliminado()
+
+        borrados = purga.purgar_usuario(self.usuario.pk, tamano_lote=1)
+
+        self.assertEqual(borrados['Respuesta'], 2)
+        self.assertFalse(Usuario.objects.filter(pk=self.usuario.pk).exists())
+        self.assertFalse(Respuesta.objects.filter(post=post).exists())
+        self.assertEqual(Respuesta.objects.filter(usuario=self.otro).count(), 1)
+        self.assertEqual(Post.objects.filter(usuario=self.otro).count(), 1)
+
+    def test_reanuda_una_purga_interrumpida(self):
+        self.usuario.marcar_eliminado()
+        borrar_en_lotes = purga._borrar_en_lotes
+
+        def fallar_en_itinerarios(queryset, tamano_lote, pausa):
+            if queryset.model is Itinerario:
+                raise RuntimeError('interrumpido')
+            return borrar_en_lotes(queryset, tamano_lote, pausa)
+
+        with mock.patch.object(purga, '_borrar_en_lotes', fallar_en_itinerarios):
+            with self.assertRaises(RuntimeError):
+                purga.purgar_usuario(self.usuario.pk)
+        self.assertFalse(Post.objects.filter(usuario=self.usuario).exists())
+        self.assertTrue(Usuario.objects.filter(pk=self.usuario.pk).exists())
+
+        borrados = purga.purgar_usuario(self.usuario.pk)
+
+        self.assertEqual(borrados['Itinerario'], 1)
+        self.assertEqual(borrados['Usuario'], 1)
+        self.assertFalse(Usuario.objects.filter(pk=self.usuario.pk).exists())
+        self.assertTrue(Usuario.objects.filter(pk=self.otro.pk).exists())
@@ -12,14 +12,28 @@ from .serializers import (
     ItinerarioConDestinosSerializer,
     PostSerializer,
     PostConRespuestasSerializer,
-    RespuestaSerializer
+    RespuestaSerializer,
+    parametros_dinamicos
 )
 
-class UsuarioViewSet(viewsets.ModelViewSet):
+class QuerysetDinamicoMixin:
+    """
+    Recorta el queryset de lectura según ?fields= y ?expand=.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        serializer_class = self.get_serializer_class()
+        if self.request.method in permissions.SAFE_METHODS and hasattr(serializer_class, 'optimizar_queryset'):
+            fields, expand = parametros_dinamicos(self.request)
+            queryset = serializer_class.optimizar_queryset(queryset, fields, expand)
+        return queryset
+
+class UsuarioViewSet(QuerysetDinamicoMixin, viewsets.ModelViewSet):
     """
     ViewSet para manejar usuarios con validaciones de contraseña y email único.
     """
-    queryset = Usuario.objects.all()
+    queryset = Usuario.objects.visibles()
     serializer_class = UsuarioSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
@@ -34,6 +48,10 @@ class UsuarioViewSet(viewsets.ModelViewSet):
             request.data['contrasena'] = make_password(request.data['contrasena'])
         return super().update(request, *args, **kwargs)
 
+    def perform_destroy(self, instance):
+        """Marca la cuenta como eliminada; purgar_usuarios borra los datos después"""
+        instance.marcar_eliminado()
+
     @action(detail=False, methods=['GET'])
     def me(self, request):
         """Endpoint para obtener datos del usuario logueado"""
@@ -45,7 +63,7 @@ class UsuarioViewSet(viewsets.ModelViewSet):
             status=status.HTTP_401_UNAUTHORIZED
         )
 
-class DestinoViewSet(viewsets.ModelViewSet):
+class DestinoViewSet(QuerysetDinamicoMixin, viewsets.ModelViewSet):
     """
     ViewSet para destinos con permisos básicos.
     """
@@ -58,11 +76,13 @@ class DestinoViewSet(viewsets.ModelViewSet):
     def itinerarios(self, request, pk=None):
         """Obtiene todos los itinerarios que incluyen este destino"""
         destino = self.get_object()
-        itinerarios = ItinerarioDestino.objects.filter(destino=destino)
-        serializer = ItinerarioDestinoSerializer(itinerarios, many=True)
+        fields, expand = parametros_dinamicos(request)
+        itinerarios = ItinerarioDestino.objects.visibles().filter(destino=destino)
+        itinerarios = ItinerarioDestinoSerializer.optimizar_queryset(itinerarios, fields, expand)
+        serializer = ItinerarioDestinoSerializer(itinerarios, many=True, fields=fields, expand=expand)
         return Response(serializer.data)
 
-class ItinerarioViewSet(viewsets.ModelViewSet):
+class ItinerarioViewSet(QuerysetDinamicoMixin, viewsets.ModelViewSet):
     """
     ViewSet para itinerarios con validación de propiedad.
     """
@@ -71,7 +91,7 @@ class ItinerarioViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Solo muestra itinerarios del usuario actual"""
-        return Itinerario.objects.filter(usuario=self.request.user)
+        return Itinerario.objects.visibles().filter(usuario=self.request.user)
 
     def get_serializer_class(self):
         """Usa serializer con destinos anidados para detalles"""
@@ -103,7 +123,7 @@ class ItinerarioViewSet(viewsets.ModelViewSet):
         serializer = ItinerarioDestinoSerializer(itinerario_destino)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
-class ItinerarioDestinoViewSet(viewsets.ModelViewSet):
+class ItinerarioDestinoViewSet(QuerysetDinamicoMixin, viewsets.ModelViewSet):
     """
     ViewSet para relación Itinerario-Destino con validaciones.
     """
@@ -112,7 +132,7 @@ class ItinerarioDestinoViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Solo muestra relaciones de itinerarios del usuario"""
-        return ItinerarioDestino.objects.filter(itinerario__usuario=self.request.user)
+        return ItinerarioDestino.objects.visibles().filter(itinerario__usuario=self.request.user)
 
     def perform_destroy(self, instance):
         """Valida propiedad antes de eliminar"""
@@ -124,11 +144,11 @@ class ItinerarioDestinoViewSet(viewsets.ModelViewSet):
             status=status.HTTP_403_FORBIDDEN
         )
 
-class PostViewSet(viewsets.ModelViewSet):
+class PostViewSet(QuerysetDinamicoMixin, viewsets.ModelViewSet):
     """
     ViewSet para posts con sistema de likes.
     """
-    queryset = Post.objects.all().order_by('-fecha_publicacion')
+    queryset = Post.objects.visibles().order_by('-fecha_publicacion')
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     def get_serializer_class(self):
@@ -151,7 +171,7 @@ class PostViewSet(viewsets.ModelViewSet):
             post.likes.add(request.user)
         return Response({"likes": post.likes.count()})
 
-class RespuestaViewSet(viewsets.ModelViewSet):
+class RespuestaViewSet(QuerysetDinamicoMixin, viewsets.ModelViewSet):
     """
     ViewSet para respuestas a posts.
     """
@@ -160,9 +180,9 @@ class RespuestaViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Filtra respuestas por post"""
-        return Respuesta.objects.filter(post_id=self.kwargs['post_pk'])
+        return Respuesta.objects.visibles().filter(post_id=self.kwargs['post_pk'])
 
     def perform_create(self, serializer):
         """Asigna usuario y post automáticamente"""
-        post = get_object_or_404(Post, pk=self.kwargs['post_pk'])
+        post = get_object_or_404(Post.objects.visibles(), pk=self.kwargs['post_pk'])
         serializer.save(usuario=self.request.user, post=post)
\ No newline at end of file
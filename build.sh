@@ -0,0 +1,7 @@
+#!/usr/bin/env bash
+# Build de Render: configurar "./build.sh" como Build Command del servicio
+set -o errexit
+
+pip install -r requirements.txt
+python manage.py collectstatic --no-input
+python manage.py migrate